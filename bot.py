@@ -34,8 +34,12 @@ import os
 import sys
 import json
 import time
+import queue
+import atexit
+import signal
 import logging
 import threading
+from logging.handlers import QueueHandler, QueueListener
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dataclasses import dataclass, field
@@ -143,13 +147,13 @@ class Market:
         return f"{m // 60}h"
 
 
-@dataclass
+@dataclass(slots=True)
 class BookLevel:
     price: float
     size: float
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderBookSnapshot:
     up_asks: list[BookLevel] = field(default_factory=list)
     up_bids: list[BookLevel] = field(default_factory=list)
@@ -1720,12 +1724,39 @@ def test_latency():
 # Entry point
 # ---------------------------------------------------------------------------
 
+def _start_log_listener():
+    """Move the root handlers behind a queue drained by a listener thread.
+
+    Timestamp formatting and stream/file I/O then run off the bot thread,
+    so logging in the poll loop costs only a queue put. Called from the
+    entry point only; importing bot keeps the synchronous handlers.
+    """
+    root = logging.getLogger()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers)
+    queue_handler = QueueHandler(log_queue)
+    # prepare() formats on the caller; keep that to the bare message and
+    # leave the full format to the listener's handlers.
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    root.handlers = [queue_handler]
+    listener.start()
+    atexit.register(listener.stop)  # drain queued records on exit
+
+
+def _handle_sigterm(signum, frame):
+    # ./start.sh stop sends SIGTERM. Unwind like Ctrl+C so run_bot prints
+    # its session summary and atexit drains the log queue.
+    raise KeyboardInterrupt
+
+
 if __name__ == "__main__":
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+    _start_log_listener()
     cmd = sys.argv[1] if len(sys.argv) > 1 else "run"
 
     if cmd == "analyze":
         analyze_trader("0x6031b6eed1c97e853c6e0f03ad3ce3529351f96d", "gabagool22")
-        print()
+        log.info("")
         analyze_trader("0xf247584e41117bbbe4cc06e4d2c95741792a5216", "Wee-Playroom")
     elif cmd == "scan":
         api = PolymarketAPI()